@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 import platform
 import signal
@@ -8,28 +7,76 @@ import time
 
 from anki.hooks import addHook
 from aqt import mw, gui_hooks
-from aqt.qt import QObject, pyqtSignal, QFileDialog, Qt, qconnect
+from aqt.qt import (
+    QAction,
+    QObject,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    QFileDialog,
+    Qt,
+    qconnect,
+)
 from aqt.utils import showInfo
-from dotenv import set_key, load_dotenv
 from performance_logger import (
     get_performance_logger,
     PerformanceTimer,
     log_startup_phase,
 )
 
-from ChatAIModuleAdapter import ChatAIModuleAdapter
+import fastjson
 from ExplainTalkButtons import ExplainTalkButtons
 from InterprocessCommand import InterprocessCommand as IC
 from OpenAIAPIKeyDialog import OpenAIAPIKeyDialog
 from PostUpdateDialog import PostUpdateDialog
 from SidePanel import SidePanel
 from UserModeDialog import show_user_mode_dialog
-from card_injection import handle_card_will_show
 from changelog import ChangelogDialog
 from project_paths import dotenv_path
 from util import run_win_install, run_macos_install, run_linux_install, UserMode
 
 
+# Parsed .env contents, keyed by file mtime so API-key saves invalidate it.
+_ENV_CACHE = {"mtime": None, "values": {}}
+
+
+def _get_env_key(name: str):
+    """
+    Read a key from the user_files .env file, re-parsing it only when it has
+    changed on disk. Falls back to the process environment.
+    """
+    from dotenv import dotenv_values
+
+    try:
+        mtime = os.stat(dotenv_path).st_mtime
+    except OSError:
+        mtime = None
+
+    if mtime != _ENV_CACHE["mtime"]:
+        _ENV_CACHE["values"] = dotenv_values(dotenv_path) if mtime is not None else {}
+        _ENV_CACHE["mtime"] = mtime
+
+    return _ENV_CACHE["values"].get(name) or os.environ.get(name)
+
+
+def _stat_documents(full_paths):
+    """Build the document dicts for a list of selected file paths."""
+    documents = []
+    for path in full_paths:
+        file_name_with_extension = os.path.basename(path)
+        file_name, extension = os.path.splitext(file_name_with_extension)
+        documents.append(
+            {
+                "file_name_with_extension": file_name_with_extension,
+                "file_name": file_name,
+                "extension": extension,
+                "path": path,
+                "size": os.path.getsize(path),
+            }
+        )
+    return documents
+
+
 # The "GUIThreadSignaler" class allows the non-UI thread to modify/update the UI thread. Some uses include
 # resetting the UI, opening a file browser, showing dialogs for missing API keys
 class GUIThreadSignaler(QObject):
@@ -51,6 +98,17 @@ class GUIThreadSignaler(QObject):
         self.showNoAPIKeyDialogSignal.connect(self.show_no_API_key_dialog)
         self.sendToJSFromAsyncThreadSignal.connect(self.send_to_js_from_async_thread)
 
+    def send_to_js(self, json_dict: dict):
+        """
+        Dispatch to the webview. Marshals through the signal (a queued,
+        cross-thread hop) only when called off the Qt thread; Qt-thread
+        callers go straight through.
+        """
+        if QThread.currentThread() is self.thread():
+            self.send_to_js_from_async_thread(json_dict)
+        else:
+            self.sendToJSFromAsyncThreadSignal.emit(json_dict)
+
     def send_to_js_from_async_thread(self, json_dict: dict):
         mw.ankiBrain.sidePanel.webview.send_to_js(json_dict)
 
@@ -74,30 +132,26 @@ class GUIThreadSignaler(QObject):
             )
             return
 
-        documents = []
-        for path in full_paths:
-            file_name_with_extension = os.path.basename(path)
-            file_name, extension = os.path.splitext(file_name_with_extension)
-            documents.append(
-                {
-                    "file_name_with_extension": os.path.basename(path),
-                    "file_name": file_name,
-                    "extension": extension,
-                    "path": path,
-                    "size": os.path.getsize(path),
-                }
+        # Stat the files off the Qt thread: os.path.getsize on a slow or
+        # networked filesystem would otherwise block the UI per file.
+        def handle_stat_done(fut):
+            documents = fut.result()
+            print(f"Selected documents: {fastjson.dumps(documents)}")
+
+            # user_mode = mw.settingsManager.get_user_mode()
+            # if user_mode == UserMode.SERVER:
+            mw.ankiBrain.reactBridge.send_cmd(
+                IC.DID_SELECT_DOCUMENTS,
+                data={"documents": documents},
+                commandId=commandId,
             )
 
-        print(f"Selected documents: {json.dumps(documents)}")
-
-        # user_mode = mw.settingsManager.get_user_mode()
-        # if user_mode == UserMode.SERVER:
-        mw.ankiBrain.reactBridge.send_cmd(
-            IC.DID_SELECT_DOCUMENTS, data={"documents": documents}, commandId=commandId
-        )
+            # elif user_mode == UserMode.LOCAL:
+            #     mw.ankiBrain.reactBridge.trigger(IC.ADD_DOCUMENTS, documents=documents)
 
-        # elif user_mode == UserMode.LOCAL:
-        #     mw.ankiBrain.reactBridge.trigger(IC.ADD_DOCUMENTS, documents=documents)
+        asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(_stat_documents, full_paths), mw.ankiBrain.loop
+        ).add_done_callback(handle_stat_done)
 
 
 # The "AnkiBrain" class is the main class. It is responsible for initializing the application, UI setup, file browser interactions,
@@ -114,52 +168,58 @@ class AnkiBrain:
         )
         log_startup_phase("AnkiBrain __init__ started", {"user_mode": user_mode.name})
 
-        with PerformanceTimer(self.logger, "set_basic_properties"):
-            self.user_mode = user_mode
-            self.loop = None
-            self.webview_loaded = False
-            self.explainTalkButtons = None
-            self.selectedText = ""
-            self.chatReady = False
-
-        with PerformanceTimer(self.logger, "create_side_panel"):
-            self.logger.startup_info("Creating SidePanel component")
-            self.sidePanel = SidePanel("AnkiBrain", mw)
-            self.sidePanel.webview.page().loadFinished.connect(
-                self.on_webengine_load_finished
-            )
-            self.logger.startup_info("SidePanel created and webview connected")
-
-        with PerformanceTimer(self.logger, "create_chat_ai_adapter"):
-            self.logger.startup_info("Creating ChatAI module adapter")
-            self.chatAI = (
-                ChatAIModuleAdapter()
-            )  # Requires async starting by calling .start
-            self.logger.startup_info("ChatAI adapter created (not started yet)")
+        # Startup phases below use bare perf_counter deltas logged with
+        # deferred %-formatting instead of PerformanceTimer: this path runs
+        # before Anki's UI is responsive, so even the per-phase context
+        # manager + structured-record overhead is worth avoiding.
+        debug = self.logger.logger.debug
+
+        t0 = time.perf_counter()
+        self.user_mode = user_mode
+        self.loop = None
+        self.webview_loaded = False
+        self.explainTalkButtons = None
+        self.selectedText = ""
+        self.chatReady = False
+        # Deferred members - constructed on first use so their Qt widget
+        # allocation / module imports stay off the cold-start critical path.
+        self.chatAI = None
+        self._openai_api_key_dialog = None
+        # Created by _start_async_members on its own loop; set from the
+        # Qt thread when the webview's loadFinished signal fires.
+        self._webview_ready_event = None
+        # Debounce state for card text-selection events.
+        self._pending_selection = None
+        self._selection_debounce_timer = QTimer(mw)
+        self._selection_debounce_timer.setSingleShot(True)
+        self._selection_debounce_timer.setInterval(50)
+        self._selection_debounce_timer.timeout.connect(self._apply_pending_selection)
+        debug("phase set_basic_properties: %.2fms", (time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        self.sidePanel = SidePanel("AnkiBrain", mw)
+        self.sidePanel.webview.page().loadFinished.connect(
+            self.on_webengine_load_finished
+        )
+        debug("phase create_side_panel: %.2fms", (time.perf_counter() - t0) * 1000)
 
-        with PerformanceTimer(self.logger, "create_api_key_dialog"):
-            self.openai_api_key_dialog = OpenAIAPIKeyDialog()
-            self.openai_api_key_dialog.hide()
-            self.logger.startup_info("OpenAI API key dialog created")
+        # ChatAI adapter and API key dialog are deferred until first use.
 
         # Should go last because this object takes self and can call items.
         # Therefore, risk of things not completing setup.
-        with PerformanceTimer(self.logger, "create_react_bridge"):
-            self.logger.startup_info(
-                "Creating ReactBridge - critical startup component"
-            )
-            from ReactBridge import ReactBridge
+        t0 = time.perf_counter()
+        from ReactBridge import ReactBridge
 
-            self.reactBridge = ReactBridge(self)
-            self.logger.startup_info("ReactBridge created successfully")
+        self.reactBridge = ReactBridge(self)
+        debug("phase create_react_bridge: %.2fms", (time.perf_counter() - t0) * 1000)
 
-        with PerformanceTimer(self.logger, "create_gui_signaler"):
-            self.guiThreadSignaler = GUIThreadSignaler()
-            self.logger.startup_info("GUI thread signaler created")
+        t0 = time.perf_counter()
+        self.guiThreadSignaler = GUIThreadSignaler()
+        debug("phase create_gui_signaler: %.2fms", (time.perf_counter() - t0) * 1000)
 
-        with PerformanceTimer(self.logger, "setup_ui_complete"):
-            self.logger.startup_info("Starting UI setup - final initialization phase")
-            self.setup_ui()
+        t0 = time.perf_counter()
+        self.setup_ui()
+        debug("phase setup_ui_complete: %.2fms", (time.perf_counter() - t0) * 1000)
 
         total_init_time = (time.time() - startup_time) * 1000
         self.logger.startup_info(
@@ -173,34 +233,50 @@ class AnkiBrain:
 
     def __del__(self):
         self.sidePanel.deleteLater()
-        asyncio.run(self.chatAI.stop())
+        if self.chatAI is not None:
+            # Fire-and-forget terminate. Never spin up an event loop here:
+            # asyncio.run during GC / interpreter shutdown blocks on
+            # process.wait() and can deadlock Anki's quit. spawn() already
+            # registers an atexit terminate as a backstop.
+            try:
+                self.chatAI.scriptManager.terminate_sync()
+            except Exception as e:
+                print(str(e))
+
+    @property
+    def openai_api_key_dialog(self):
+        """Construct the API key dialog lazily on first access."""
+        if self._openai_api_key_dialog is None:
+            self._openai_api_key_dialog = OpenAIAPIKeyDialog()
+            self._openai_api_key_dialog.on_key_save(self.handle_openai_api_key_save)
+            self._openai_api_key_dialog.hide()
+        return self._openai_api_key_dialog
 
     def setup_ui(self):
         mw.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.sidePanel)
         self.sidePanel.resize(500, mw.height())
 
-        # Set up api key dialog.
-        self.openai_api_key_dialog.on_key_save(self.handle_openai_api_key_save)
-
         # Hook for injecting custom javascript into Anki cards.
-        addHook("prepareQA", handle_card_will_show)
+        # Registered via a thin wrapper so card_injection is only imported
+        # when the first card is actually shown.
+        addHook("prepareQA", self._handle_card_will_show)
 
         # Hook for Anki's card webview JS function `pycmd`
         gui_hooks.webview_did_receive_js_message.append(
             self.handle_anki_card_webview_pycmd
         )
 
-        add_ankibrain_menu_item("Show/Hide AnkiBrain", self.toggle_panel)
-        add_ankibrain_menu_item("Switch User Mode...", show_user_mode_dialog)
+        menu_items = [
+            ("Show/Hide AnkiBrain", self.toggle_panel),
+            ("Switch User Mode...", show_user_mode_dialog),
+        ]
 
         if self.user_mode == UserMode.LOCAL:
-            add_ankibrain_menu_item(
-                "Restart AI...", self.restart_async_members_from_sync
-            )
-            add_ankibrain_menu_item(
-                "Set OpenAI API Key...", self.show_openai_api_key_dialog
-            )
-            add_ankibrain_menu_item("Reinstall...", reinstall)
+            menu_items += [
+                ("Restart AI...", self.restart_async_members_from_sync),
+                ("Set OpenAI API Key...", self.show_openai_api_key_dialog),
+                ("Reinstall...", reinstall),
+            ]
 
         # Check if AnkiBrain has been updated.
         has_updated = mw.settingsManager.has_ankibrain_updated()
@@ -210,15 +286,24 @@ class AnkiBrain:
             mw.updateDialog = PostUpdateDialog(mw)
             mw.updateDialog.show()
 
-        add_ankibrain_menu_item("Show Changelog", show_changelog)
+        menu_items.append(("Show Changelog", show_changelog))
+        add_ankibrain_menu_items(menu_items)
         self.main()
 
+    def _handle_card_will_show(self, text, card, kind):
+        """Thin prepareQA wrapper; defers the card_injection import to first card render."""
+        from card_injection import handle_card_will_show
+
+        return handle_card_will_show(text, card, kind)
+
     def on_webengine_load_finished(self):
         """Webview load completion handler with performance logging."""
         self.logger.startup_info(
             "Webview finished loading - critical milestone reached"
         )
         self.webview_loaded = True
+        if self.loop is not None and self._webview_ready_event is not None:
+            self.loop.call_soon_threadsafe(self._webview_ready_event.set)
         log_startup_phase("WebEngine Load Completed")
 
     async def load_user_settings(self):
@@ -242,44 +327,59 @@ class AnkiBrain:
         )
         log_startup_phase("Async Members Startup Started")
 
-        # Make sure webview is loaded - potential bottleneck #1
-        webview_wait_start = time.time()
-        webview_wait_iterations = 0
-        while not self.webview_loaded:
-            webview_wait_iterations += 1
-            self.logger.startup_warning(
-                f"Webview not loaded yet - waiting (iteration {webview_wait_iterations})",
-                {"wait_time_ms": round((time.time() - webview_wait_start) * 1000, 2)},
+        # Kick off the independent long-latency work immediately so the
+        # subprocess boot and .env disk read overlap with the webview load
+        # instead of running after it.
+        chatai_task = None
+        api_key_task = None
+        chatai_start_time = None
+        if self.user_mode == UserMode.LOCAL:
+            if self.chatAI is None:
+                self.logger.startup_info("Creating ChatAI module adapter")
+                # Deferred import: pulls in the ChatAI module tree, which
+                # is not needed before the AI engine actually starts.
+                from ChatAIModuleAdapter import ChatAIModuleAdapter
+
+                self.chatAI = ChatAIModuleAdapter()
+
+            self.logger.startup_info("Starting ChatAI - MAJOR BOTTLENECK EXPECTED")
+            chatai_start_time = time.time()
+            chatai_task = asyncio.create_task(self.chatAI.start())
+
+            api_key_task = asyncio.create_task(
+                asyncio.to_thread(_get_env_key, "OPENAI_API_KEY")
             )
-            await asyncio.sleep(0.1)
-
-            # Log if webview loading is taking too long
-            if webview_wait_iterations % 50 == 0:  # Every 5 seconds
-                wait_time = (time.time() - webview_wait_start) * 1000
-                self.logger.startup_error(
-                    f"Webview loading bottleneck detected - waited {wait_time:.1f}ms",
-                    {"iterations": webview_wait_iterations, "wait_time_ms": wait_time},
+
+        # Make sure webview is loaded - potential bottleneck #1.
+        # We block on an event set from the loadFinished signal instead of
+        # polling, so we wake up the instant the webview is ready.
+        webview_wait_start = time.time()
+        if not self.webview_loaded:
+            self._webview_ready_event = asyncio.Event()
+            # Re-check after publishing the event: a load that finished in
+            # between would otherwise be a lost wakeup.
+            if not self.webview_loaded:
+                self.logger.startup_info(
+                    "Webview not loaded yet - awaiting loadFinished signal"
                 )
+                await self._webview_ready_event.wait()
 
         webview_wait_time = (time.time() - webview_wait_start) * 1000
         self.logger.startup_info(
             "Webview loading completed",
-            {
-                "wait_time_ms": round(webview_wait_time, 2),
-                "iterations": webview_wait_iterations,
-            },
+            {"wait_time_ms": round(webview_wait_time, 2)},
         )
 
-        if self.user_mode == UserMode.LOCAL:
+        if chatai_task is not None:
             with PerformanceTimer(self.logger, "chatai_startup_sequence"):
                 self.reactBridge.send_cmd(
                     IC.SET_WEBAPP_LOADING_TEXT, {"text": "Starting AI Engine..."}
                 )
-                self.logger.startup_info("Starting ChatAI - MAJOR BOTTLENECK EXPECTED")
 
-                # This is likely the biggest bottleneck - starting external Python process
-                chatai_start_time = time.time()
-                await self.chatAI.start()
+                # This is likely the biggest bottleneck - starting the external
+                # Python process. It has been running since before the webview
+                # wait; join it here.
+                await chatai_task
                 chatai_duration = (time.time() - chatai_start_time) * 1000
 
                 self.chatReady = True
@@ -309,8 +409,9 @@ class AnkiBrain:
         if self.user_mode == UserMode.LOCAL:
             with PerformanceTimer(self.logger, "api_key_validation"):
                 self.logger.startup_info("Validating OpenAI API key")
-                load_dotenv(dotenv_path, override=True)
-                api_key = os.getenv("OPENAI_API_KEY")
+                # .env was parsed in a worker thread alongside the subprocess
+                # boot (and is cached by mtime); just join it for the key.
+                api_key = await api_key_task if api_key_task is not None else None
 
                 if api_key is None or api_key == "":
                     self.logger.startup_warning(
@@ -342,7 +443,7 @@ class AnkiBrain:
         Stop all async members here.
         :return:
         """
-        if self.user_mode == UserMode.LOCAL:
+        if self.user_mode == UserMode.LOCAL and self.chatAI is not None:
             print("Stopping AnkiBrain...")
             await self.chatAI.stop()
             self.chatReady = False
@@ -373,6 +474,8 @@ class AnkiBrain:
         return output
 
     def handle_openai_api_key_save(self, key):
+        from dotenv import set_key
+
         self.openai_api_key_dialog.hide()
         set_key(dotenv_path, "OPENAI_API_KEY", key)
         os.environ["OPENAI_API_KEY"] = key
@@ -407,6 +510,15 @@ class AnkiBrain:
         t.daemon = True
         t.start()
         try:
+            if self.user_mode == UserMode.LOCAL:
+                # Prewarm the ChatAI subprocess immediately so the child
+                # interpreter's import time overlaps with the webview load.
+                if self.chatAI is None:
+                    from ChatAIModuleAdapter import ChatAIModuleAdapter
+
+                    self.chatAI = ChatAIModuleAdapter()
+                asyncio.run_coroutine_threadsafe(self.chatAI.spawn(), loop)
+
             asyncio.run_coroutine_threadsafe(self._start_async_members(), loop)
         except Exception as e:
             print(e)
@@ -434,7 +546,8 @@ class AnkiBrain:
 
     def handle_anki_card_webview_pycmd(self, handled, cmd, context):
         try:
-            data = json.loads(cmd)
+            # Hot path: fires for every mousedown/selection on a card.
+            data = fastjson.loads(cmd)
             if data["cmd"] == "selectedText":
                 print("detected text selection")
                 self.handle_text_selected(text=data["text"], position=data["position"])
@@ -450,6 +563,19 @@ class AnkiBrain:
             return handled
 
     def handle_text_selected(self, text="", position=None):
+        # Debounce: a drag-selection fires this repeatedly, and each widget
+        # rebuild is a heavy Qt allocation. Remember the latest selection and
+        # only build the buttons once events settle for 50ms.
+        self._pending_selection = (text, position)
+        self._selection_debounce_timer.start()
+
+    def _apply_pending_selection(self):
+        if self._pending_selection is None:
+            return
+
+        text, position = self._pending_selection
+        self._pending_selection = None
+
         if self.explainTalkButtons is not None:
             self.explainTalkButtons.destroy()
 
@@ -463,6 +589,13 @@ class AnkiBrain:
 
     # Basically detecting highlight release.
     def handle_mousedown(self):
+        # A new mousedown supersedes any selection still waiting to show.
+        self._pending_selection = None
+        self._selection_debounce_timer.stop()
+
+        # No throttle here: destroy() is idempotent and cheap, and skipping
+        # it on a rapid second click could leave the buttons on screen with
+        # stale selectedText. Only widget creation is debounced.
         if self.explainTalkButtons is not None:
             self.explainTalkButtons.destroy()
 
@@ -485,14 +618,18 @@ class AnkiBrain:
         self.selectedText = ""
 
 
+_INSTALLERS = {
+    "Windows": run_win_install,
+    "Darwin": run_macos_install,
+    "Linux": run_linux_install,
+}
+_SYSTEM = platform.system()
+
+
 def reinstall():
-    system = platform.system()
-    if system == "Windows":
-        run_win_install()
-    elif system == "Darwin":
-        run_macos_install()
-    elif system == "Linux":
-        run_linux_install()
+    installer = _INSTALLERS.get(_SYSTEM)
+    if installer is not None:
+        installer()
 
     showInfo(
         "Terminal updater has been launched. Restart Anki after install is completed."
@@ -504,12 +641,26 @@ def show_changelog():
     mw.changelog.show()
 
 
-def add_ankibrain_menu_item(name: str, fn):
-    action = mw.ankibrain_menu.addAction(name)
-    qconnect(action.triggered, fn)
+def add_ankibrain_menu_items(items):
+    """
+    Create and connect QActions for (name, fn) pairs, then add them to the
+    menu with a single addActions call so Qt lays the menu out once instead
+    of once per action.
+    """
+    actions = []
+    for name, fn in items:
+        action = QAction(name, mw.ankibrain_menu)
+        qconnect(action.triggered, fn)
+        actions.append(action)
+
+    mw.ankibrain_menu.addActions(actions)
 
     # Keep track of added actions for removal later if needed.
-    mw.menu_actions.append(action)
+    mw.menu_actions.extend(actions)
+
+
+def add_ankibrain_menu_item(name: str, fn):
+    add_ankibrain_menu_items([(name, fn)])
 
 
 def remove_ankibrain_menu_actions():
@@ -1,11 +1,8 @@
 import json
+from functools import lru_cache
 from os import path
 from typing import Tuple
 
-from langchain import ConversationChain
-from langchain.chat_models import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-
 from .ChatInterface import ChatInterface
 import sys
 import os
@@ -17,28 +14,61 @@ user_data_dir = path.join(path.abspath(path.dirname(__file__)), "..", "user_file
 settings_path = path.join(user_data_dir, "settings.json")
 
 
+@lru_cache(maxsize=1)
+def _load_settings_for_mtime(mtime: float) -> Tuple[float, str, int]:
+    """Parse settings.json once per on-disk version (keyed by mtime)."""
+    with open(settings_path, "r") as f:
+        data = json.load(f)
+    return (
+        data["temperature"],
+        data["llmModel"],
+        data.get("conversationWindowSize", 8),
+    )
+
+
+def _load_settings() -> Tuple[float, str, int]:
+    """
+    Return (temperature, llm_model) from settings.json, re-reading the file
+    only when it has changed on disk. Restart paths construct this class
+    repeatedly, so the parsed settings are memoized.
+    """
+    return _load_settings_for_mtime(os.stat(settings_path).st_mtime)
+
+
+@lru_cache(maxsize=4)
+def _get_llm(temperature, model_name):
+    """
+    Cache ChatOpenAI clients per (temperature, model). Each client owns an
+    HTTP connection pool that is expensive to rebuild, and the module
+    constructs several ChatAIWithoutDocuments instances with identical
+    settings. The LLM client is stateless; conversation state lives in the
+    per-instance memory/chain.
+    """
+    from langchain.chat_models import ChatOpenAI
+
+    return ChatOpenAI(temperature=temperature, model_name=model_name)
+
+
 class ChatAIWithoutDocuments(ChatInterface):
     def __init__(self, verbose=False):
-        # Import here to avoid linting issues with imports
-        import sys
-        import os
+        # Deferred imports: langchain is expensive to import, so merely
+        # importing this module (e.g. via ChatAIModuleAdapter discovery)
+        # should not drag it in.
+        from langchain import ConversationChain
+        from langchain.memory import ConversationBufferWindowMemory
 
-        sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
         from model_compatibility import get_compatible_model_name, log_model_usage
 
-        temperature = 0
-        model_name = "gpt-3.5-turbo"
-        with open(settings_path, "r") as f:
-            data = json.load(f)
-            temperature = data["temperature"]
-            model_name = data["llmModel"]
+        temperature, model_name, window_size = _load_settings()
 
         # Apply model compatibility mapping for unsupported models (e.g., GPT-5)
         compatible_model = get_compatible_model_name(model_name)
         log_model_usage(model_name, compatible_model)
 
-        self.llm = ChatOpenAI(temperature=temperature, model_name=compatible_model)
-        self.memory = ConversationBufferMemory()
+        self.llm = _get_llm(temperature, compatible_model)
+        # Windowed memory caps prompt growth: only the last N turns are sent
+        # per message instead of the whole session history.
+        self.memory = ConversationBufferWindowMemory(k=window_size)
         self.conversationChain = ConversationChain(
             llm=self.llm, memory=self.memory, verbose=verbose
         )
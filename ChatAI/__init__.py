@@ -15,10 +15,32 @@ ankibrain_project_root_dir = path.join(module_dir, "..")
 user_data_dir = path.join(ankibrain_project_root_dir, "user_files")
 dotenv_path = path.join(user_data_dir, ".env")
 
+sys.path.append(ankibrain_project_root_dir)
+import fastjson  # noqa: E402
+
+
+# IPC frame header size - must match ExternalScriptManager on the addon side.
+# Each message is a 4-byte big-endian payload length followed by JSON bytes.
+FRAME_HEADER_SIZE = 4
+
 
 def _module_return(data: dict[str, str]):
-    print(json.dumps(data))
-    sys.stdout.flush()
+    payload = fastjson.dumps_bytes(data)
+    sys.stdout.buffer.write(len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload)
+    sys.stdout.buffer.flush()
+
+
+def _read_module_input() -> bytes:
+    """
+    Read one length-prefixed message payload from stdin.
+    Returns empty bytes on EOF (parent closed the pipe).
+    """
+    header = sys.stdin.buffer.read(FRAME_HEADER_SIZE)
+    if len(header) < FRAME_HEADER_SIZE:
+        return b""
+
+    payload_size = int.from_bytes(header, "big")
+    return sys.stdin.buffer.read(payload_size)
 
 
 def module_return(cmd: IC, data: dict[str, Any] = None):
@@ -160,12 +182,13 @@ if __name__ == "__main__":
 
     with get_openai_callback() as oa_cb:
         while True:
-            input_line = sys.stdin.readline().strip()
-            if not input_line:
-                continue
+            input_payload = _read_module_input()
+            if not input_payload:
+                # Parent closed the pipe; nothing more will arrive.
+                break
 
             try:
-                input_data = json.loads(input_line)
+                input_data = fastjson.loads(input_payload)
                 if not input_data or not isinstance(input_data, dict):
                     module_error(
                         f"<ChatAI Module> Malformed module input: {str(input_data)}"
@@ -177,6 +200,6 @@ if __name__ == "__main__":
                 except Exception as e:
                     module_error(str(e))
             except json.JSONDecodeError:
-                module_error(f"Invalid JSON input: {input_line}")
+                module_error(f"Invalid JSON input: {input_payload!r}")
             except Exception as e:
                 module_error(str(e))
@@ -23,6 +23,10 @@ class ChatAIModuleAdapter:
             python_path=python_path, script_path=ChatAI_module_init_path
         )
 
+    async def spawn(self):
+        """Prewarm: launch the subprocess without waiting for its ready message."""
+        await self.scriptManager.spawn()
+
     async def start(self):
         await self.scriptManager.start()
 
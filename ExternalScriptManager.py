@@ -5,6 +5,7 @@ import platform
 import subprocess
 import time
 
+import fastjson
 from InterprocessCommand import InterprocessCommand
 from performance_logger import (
     get_performance_logger,
@@ -13,6 +14,17 @@ from performance_logger import (
 )
 
 
+# Platform detection is cached at import: platform.system() is not free and
+# the result can't change while Anki is running.
+_IS_WINDOWS = platform.system() == "Windows"
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if _IS_WINDOWS else 0
+
+# IPC frame header size. Each message is a 4-byte big-endian payload length
+# followed by the JSON payload bytes; readexactly avoids readline's
+# byte-by-byte newline scan and is immune to newlines inside payloads.
+FRAME_HEADER_SIZE = 4
+
+
 class ExternalScriptManager:
     def __init__(self, python_path, script_path):
         """Initialize ExternalScriptManager with comprehensive performance logging."""
@@ -20,6 +32,8 @@ class ExternalScriptManager:
         self.script_path = script_path
         self.process = None
         self.lock = asyncio.Lock()
+        self.spawn_lock = asyncio.Lock()
+        self._startup_start_time = time.time()
 
         # Create logger for external script management
         self.logger = get_performance_logger("ExternalScriptManager")
@@ -30,57 +44,75 @@ class ExternalScriptManager:
 
     async def start(self):
         """Start external Python subprocess - MAJOR PERFORMANCE BOTTLENECK."""
-        startup_start_time = time.time()
-        self.logger.startup_info(
-            "Starting external Python subprocess - CRITICAL BOTTLENECK"
-        )
-        log_startup_phase("ExternalScriptManager Subprocess Start")
+        await self.await_ready()
+
+    async def spawn(self):
+        """
+        Spawn the external Python subprocess without waiting for its ready
+        message. Safe to call early (prewarm) and more than once - the spawn
+        lock makes extra calls no-ops while a process is alive.
+        """
+        async with self.spawn_lock:
+            if self.process is not None:
+                return
+
+            self._startup_start_time = time.time()
+            self.logger.startup_info(
+                "Starting external Python subprocess - CRITICAL BOTTLENECK"
+            )
+            log_startup_phase("ExternalScriptManager Subprocess Start")
 
-        with PerformanceTimer(self.logger, "setup_subprocess_parameters"):
-            creationflags = 0
-            if platform.system() == "Windows":
-                creationflags = subprocess.CREATE_NO_WINDOW
-                self.logger.startup_info(
-                    "Windows detected - using CREATE_NO_WINDOW flag"
-                )
-            else:
+            if _IS_WINDOWS:
+                self.logger.startup_info("Windows detected - using CREATE_NO_WINDOW flag")
+
+            with PerformanceTimer(self.logger, "create_subprocess_exec"):
                 self.logger.startup_info(
-                    f"Platform: {platform.system()} - no special flags"
+                    "Creating subprocess with asyncio.create_subprocess_exec",
+                    {
+                        "python_path": self.python_path,
+                        "script_path": self.script_path,
+                        "stream_limit_bytes": 1 << 20,
+                    },
                 )
 
-        with PerformanceTimer(self.logger, "create_subprocess_exec"):
-            self.logger.startup_info(
-                "Creating subprocess with asyncio.create_subprocess_exec",
-                {
-                    "python_path": self.python_path,
-                    "script_path": self.script_path,
-                    "memory_limit_gb": 1,
-                },
-            )
+                subprocess_start_time = time.time()
+                self.process = await asyncio.create_subprocess_exec(
+                    self.python_path,
+                    self.script_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    creationflags=_CREATION_FLAGS,
+                    # StreamReader buffer ceiling. The old value was 1 TiB
+                    # (commented as "1 GB"), which effectively disabled
+                    # back-pressure on stdout. 1 MiB comfortably covers the
+                    # largest chat responses; framed reads use readexactly,
+                    # which is not bounded by this limit anyway.
+                    limit=1 << 20,  # 1 MiB
+                )
+                subprocess_creation_time = (time.time() - subprocess_start_time) * 1000
 
-            subprocess_start_time = time.time()
-            self.process = await asyncio.create_subprocess_exec(
-                self.python_path,
-                self.script_path,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                creationflags=creationflags,
-                limit=1024 * 1024 * 1024 * 1024,  # 1 GB
-            )
-            subprocess_creation_time = (time.time() - subprocess_start_time) * 1000
+                self.logger.startup_info(
+                    "Subprocess created successfully",
+                    {
+                        "creation_time_ms": round(subprocess_creation_time, 2),
+                        "process_pid": self.process.pid if self.process else "unknown",
+                    },
+                )
 
-            self.logger.startup_info(
-                "Subprocess created successfully",
-                {
-                    "creation_time_ms": round(subprocess_creation_time, 2),
-                    "process_pid": self.process.pid if self.process else "unknown",
-                },
-            )
+            with PerformanceTimer(self.logger, "register_exit_handler"):
+                atexit.register(self.process.terminate)
+                self.logger.startup_info(
+                    "Exit handler registered for subprocess cleanup"
+                )
 
-        with PerformanceTimer(self.logger, "register_exit_handler"):
-            atexit.register(self.process.terminate)
-            self.logger.startup_info("Exit handler registered for subprocess cleanup")
+    async def await_ready(self):
+        """
+        Wait for the ready message from the external script, spawning the
+        subprocess first if a prewarm has not already done so.
+        """
+        await self.spawn()
+        startup_start_time = self._startup_start_time
 
         # Wait for the ready message from external script - MAJOR BOTTLENECK
         with PerformanceTimer(self.logger, "wait_for_ready_message"):
@@ -91,7 +123,7 @@ class ExternalScriptManager:
             ready_wait_start = time.time()
             try:
                 ready_msg = await asyncio.wait_for(
-                    self.process.stdout.readline(),
+                    self._read_frame(),
                     timeout=60.0,  # 60 second timeout
                 )
                 ready_wait_time = (time.time() - ready_wait_start) * 1000
@@ -118,7 +150,7 @@ class ExternalScriptManager:
 
         with PerformanceTimer(self.logger, "parse_ready_message"):
             try:
-                ready_data = json.loads(ready_msg.decode().strip())
+                ready_data = fastjson.loads(ready_msg)
                 self.logger.startup_info("Ready message parsed", {"data": ready_data})
 
                 if ready_data["status"] == "success":
@@ -160,6 +192,8 @@ class ExternalScriptManager:
         if self.process is not None:
             self.process.terminate()
             await self.process.wait()
+            # Allow a later spawn() to start a fresh process.
+            self.process = None
 
     def terminate_sync(self):
         if self.process is None:
@@ -168,16 +202,30 @@ class ExternalScriptManager:
         print("Terminating ChatAI subprocess...")
         self.process.terminate()
 
+    async def _read_frame(self) -> bytes:
+        """Read one length-prefixed message payload from the subprocess."""
+        header = await self.process.stdout.readexactly(FRAME_HEADER_SIZE)
+        payload_size = int.from_bytes(header, "big")
+        return await self.process.stdout.readexactly(payload_size)
+
+    def _write_frame(self, payload: bytes):
+        """Write one length-prefixed message payload to the subprocess."""
+        self.process.stdin.write(
+            len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload
+        )
+
     async def call(self, input_data: dict[str, str]) -> dict[str, str]:
         try:
-            data_str: str = json.dumps(input_data)
-            async with self.lock:  # Acquire lock before writing and draining
-                self.process.stdin.write(data_str.encode() + b"\n")
+            payload = fastjson.dumps_bytes(input_data)
+            # Hold the lock across write+read so concurrent calls can't
+            # interleave and pick up each other's responses.
+            async with self.lock:
+                self._write_frame(payload)
                 await self.process.stdin.drain()
+                output_payload = await self._read_frame()
 
-            output_str = await self.process.stdout.readline()
-            async with self.lock:  # Acquire lock again before loading the json
-                output_data = json.loads(output_str.decode().strip())
+            # Decoding is CPU-bound on a local buffer - no lock needed.
+            output_data = fastjson.loads(output_payload)
 
             # Handle module error.
             if output_data["cmd"] == InterprocessCommand.SUBMODULE_ERROR.value:
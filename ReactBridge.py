@@ -39,7 +39,7 @@ class ReactBridge:
 
     def send_to_js(self, json_dict: dict):
         try:
-            self.app.guiThreadSignaler.sendToJSFromAsyncThreadSignal.emit(json_dict)
+            self.app.guiThreadSignaler.send_to_js(json_dict)
         except Exception as e:
             print(str(e))
 
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import time
 from os import path
 
@@ -9,13 +10,17 @@ VERSION = "0.7.4"
 startup_timer = time.time()
 
 # Necessary to bootstrap this way so we can start importing other modules in the root folder.
-sys.path.insert(1, path.abspath(path.dirname(__file__)))
+_addon_root = path.abspath(path.dirname(__file__))
+if _addon_root not in sys.path:
+    sys.path.insert(1, _addon_root)
 
 # Import performance logging system
 from performance_logger import (  # noqa: E402
     get_performance_logger,
     log_startup_phase,
-    PerformanceTimer,
+    log_system_info,
+    FastTimer,
+    flush_pending_timers,
 )
 
 # Create logger for main initialization
@@ -24,7 +29,35 @@ logger.startup_info(
     f"AnkiBrain v{VERSION} initialization started", {"version": VERSION}
 )
 
-with PerformanceTimer(logger, "import_project_paths"):
+# Only the profileLoaded hook is registered eagerly. Everything else
+# (project paths, version file, the boot module and its imports) is resolved
+# once the profile actually loads, keeping add-on import time off Anki's
+# splash-to-main-window interval.
+from anki.hooks import addHook  # noqa: E402
+
+# Public names resolved lazily via PEP 562 so importing this module does not
+# drag in boot (and transitively aqt widgets) at add-on load time.
+_LAZY = {
+    "load_ankibrain": ("boot", "load_ankibrain"),
+    "add_ankibrain_menu": ("boot", "add_ankibrain_menu"),
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _setup_paths_and_version_file():
+    """Deferred bootstrap: module search paths plus the version marker file."""
+    from aqt import mw
     from project_paths import (
         ChatAI_module_dir,
         version_file_path,
@@ -32,45 +65,44 @@ with PerformanceTimer(logger, "import_project_paths"):
         bundled_deps_dor,
     )
 
-with PerformanceTimer(logger, "setup_python_paths"):
-    logger.startup_info(
-        "Setting up Python module paths",
-        {
-            "ChatAI_module_dir": ChatAI_module_dir,
-            "venv_site_packages_path": venv_site_packages_path,
-            "bundled_deps_dor": bundled_deps_dor,
-        },
-    )
-    sys.path.insert(1, ChatAI_module_dir)
-    sys.path.insert(1, venv_site_packages_path)
-
-    # Also insert bundled_dependencies folder for server mode (needs httpx lib).
-    sys.path.insert(1, bundled_deps_dor)
-
-with PerformanceTimer(logger, "import_anki_dependencies"):
-    from anki.hooks import addHook
-    from aqt import mw
-
-with PerformanceTimer(logger, "setup_version_file"):
-    mw.CURRENT_VERSION = VERSION
-    if path.isfile(version_file_path):
+    with FastTimer("setup_python_paths"):
         logger.startup_info(
-            "Removing existing version file", {"path": version_file_path}
+            "Setting up Python module paths",
+            {
+                "ChatAI_module_dir": ChatAI_module_dir,
+                "venv_site_packages_path": venv_site_packages_path,
+                "bundled_deps_dor": bundled_deps_dor,
+            },
         )
-        os.remove(version_file_path)
-    with open(version_file_path, "w") as f:
-        f.write(mw.CURRENT_VERSION)
-    logger.startup_info(
-        "Created version file", {"version": VERSION, "path": version_file_path}
-    )
-
-with PerformanceTimer(logger, "import_boot_modules"):
-    from boot import load_ankibrain, add_ankibrain_menu
-
-log_startup_phase(
-    "Module imports completed",
-    {"total_init_time_ms": round((time.time() - startup_timer) * 1000, 2)},
-)
+        # One splice instead of three inserts, skipping entries already
+        # present so a profile reload does not duplicate them. The list is
+        # written in final search order, matching what the old repeated
+        # insert(1, ...) calls produced (bundled_dependencies is needed for
+        # server mode's httpx lib).
+        new_paths = [
+            p
+            for p in (bundled_deps_dor, venv_site_packages_path, ChatAI_module_dir)
+            if p not in sys.path
+        ]
+        sys.path[1:1] = new_paths
+
+    with FastTimer("setup_version_file"):
+        mw.CURRENT_VERSION = VERSION
+        # The file only changes on upgrade, so skip the rewrite when the
+        # on-disk content already matches and keep the common boot path to a
+        # single read.
+        try:
+            with open(version_file_path, "r") as f:
+                version_file_current = f.read().strip() == VERSION
+        except FileNotFoundError:
+            version_file_current = False
+
+        if not version_file_current:
+            with open(version_file_path, "w") as f:
+                f.write(mw.CURRENT_VERSION)
+            logger.startup_info(
+                "Created version file", {"version": VERSION, "path": version_file_path}
+            )
 
 
 def handle_anki_boot():
@@ -81,22 +113,45 @@ def handle_anki_boot():
     boot_logger = get_performance_logger("AnkiBootHandler")
     boot_logger.startup_info("Anki profile loaded - starting AnkiBrain boot sequence")
 
-    with PerformanceTimer(boot_logger, "add_ankibrain_menu"):
+    # System probes (platform.platform()/processor(), psutil memory read) can
+    # block for 100ms+ on some OSes, so they run concurrently with boot.
+    threading.Thread(target=log_system_info, daemon=True).start()
+
+    with FastTimer("setup_paths_and_version_file"):
+        _setup_paths_and_version_file()
+
+    with FastTimer("import_boot_modules"):
+        from boot import load_ankibrain, add_ankibrain_menu
+        from aqt import mw
+
+    with FastTimer("add_ankibrain_menu"):
         # This function body gets executed once per boot, so we ensure we don't add duplicate menu buttons.
         add_ankibrain_menu()
 
-    with PerformanceTimer(boot_logger, "setup_menu_actions"):
+    with FastTimer("setup_menu_actions"):
         # Keep track of menu actions references, so we can delete them later if we need to.
         mw.menu_actions = []
 
-    with PerformanceTimer(boot_logger, "load_ankibrain_main"):
+    with FastTimer("load_ankibrain_main"):
         # Ignition sequence - this is where the heavy lifting happens
-        boot_logger.startup_info("Starting main AnkiBrain loading sequence")
         load_ankibrain()
 
-    boot_logger.startup_info("AnkiBrain boot sequence completed successfully")
     log_startup_phase("AnkiBrain fully initialized")
 
+    # Emit all deferred FastTimer measurements in one batch, off the
+    # per-phase critical path.
+    flush_pending_timers()
+
+
+# Forces eager resolution of the lazy exports (useful for CI/import checks).
+if os.environ.get("ANKIBRAIN_EAGER_IMPORT") == "1":
+    for _name in list(_LAZY):
+        __getattr__(_name)
 
 logger.startup_info("Registering profileLoaded hook")
 addHook("profileLoaded", handle_anki_boot)
+
+log_startup_phase(
+    "Module imports completed",
+    {"total_init_time_ms": round((time.time() - startup_timer) * 1000, 2)},
+)
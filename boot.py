@@ -1,4 +1,7 @@
 import shutil
+import threading
+import types
+from functools import lru_cache
 from os import path
 
 from aqt import mw
@@ -7,7 +10,7 @@ from aqt.utils import showInfo
 from project_paths import root_project_dir
 from performance_logger import (
     get_performance_logger,
-    PerformanceTimer,
+    FastTimer,
     log_startup_phase,
 )
 
@@ -16,22 +19,83 @@ boot_logger = get_performance_logger("BootModule")
 boot_logger.startup_info("Boot module loaded")
 
 
+# Deferred-import namespaces, memoized so each heavy module is imported at
+# most once and repeat calls cost a single cached-function lookup instead of
+# re-running IMPORT_NAME/IMPORT_FROM bytecode. Grouped by when they are
+# first needed so the rare paths (e.g. mode-selection dialog) do not pull in
+# modules they never use.
+@lru_cache(maxsize=1)
+def _core_imports():
+    """Modules every load path needs: settings plus user-mode plumbing."""
+    from util import UserMode, has_ankibrain_completed_install
+    from settings import SettingsManager
+    from project_paths import settings_path
+
+    return types.SimpleNamespace(
+        UserMode=UserMode,
+        has_ankibrain_completed_install=has_ankibrain_completed_install,
+        SettingsManager=SettingsManager,
+        settings_path=settings_path,
+    )
+
+
+@lru_cache(maxsize=1)
+def _ankibrain_imports():
+    """The AnkiBrainModule surface used by local/server mode and unload."""
+    from AnkiBrainModule import (
+        AnkiBrain,
+        add_ankibrain_menu_item,
+        remove_ankibrain_menu_actions,
+    )
+
+    return types.SimpleNamespace(
+        AnkiBrain=AnkiBrain,
+        add_ankibrain_menu_item=add_ankibrain_menu_item,
+        remove_ankibrain_menu_actions=remove_ankibrain_menu_actions,
+    )
+
+
+@lru_cache(maxsize=1)
+def _install_dialog_imports():
+    """Installation dialog, only needed when install is incomplete."""
+    from InstallDialog import InstallDialog, show_install_dialog
+
+    return types.SimpleNamespace(
+        InstallDialog=InstallDialog,
+        show_install_dialog=show_install_dialog,
+    )
+
+
 def add_ankibrain_menu():
     """Create AnkiBrain menu in Anki's menu bar."""
-    with PerformanceTimer(boot_logger, "create_ankibrain_menu"):
+    with FastTimer("create_ankibrain_menu"):
         boot_logger.startup_info("Creating AnkiBrain menu")
         ankibrain_menu = mw.form.menubar.addMenu("AnkiBrain")
         mw.ankibrain_menu = ankibrain_menu
         boot_logger.startup_info("AnkiBrain menu created successfully")
 
 
+def _remove_old_venv(old_venv_path):
+    """Delete the legacy venv directory and log the outcome."""
+    try:
+        shutil.rmtree(old_venv_path)
+        boot_logger.startup_info("Successfully removed old venv directory")
+    except Exception as e:
+        boot_logger.startup_error(
+            "Failed to remove old venv directory",
+            {"error": str(e)},
+            exc_info=True,
+        )
+        print(str(e))
+
+
 def run_boot_checks():
     """
     Check for python dependencies in user_files/venv
     TODO: check if installed dependencies match requirements.txt
     :return:
     """
-    with PerformanceTimer(boot_logger, "run_boot_checks"):
+    with FastTimer("run_boot_checks"):
         boot_logger.startup_info("Running boot checks")
 
         # Delete /venv, it should be in /user_files/venv. This should work since the ChatAI module
@@ -42,16 +106,16 @@ def run_boot_checks():
             boot_logger.startup_warning(
                 "Found old venv directory - removing", {"path": old_venv_path}
             )
-            try:
-                shutil.rmtree(old_venv_path)
-                boot_logger.startup_info("Successfully removed old venv directory")
-            except Exception as e:
-                boot_logger.startup_error(
-                    "Failed to remove old venv directory",
-                    {"error": str(e)},
-                    exc_info=True,
-                )
-                print(str(e))
+            # rmtree on a large venv can take seconds; nothing later in boot
+            # depends on it being gone (the live venv is user_files/venv),
+            # so the deletion runs on a background thread and only the isdir
+            # stat stays on the critical path.
+            threading.Thread(
+                target=_remove_old_venv,
+                args=(old_venv_path,),
+                daemon=True,
+                name="ankibrain-cleanup-venv",
+            ).start()
         else:
             boot_logger.startup_info("No old venv directory found - clean state")
 
@@ -61,58 +125,52 @@ def run_boot_checks():
 def load_ankibrain():
     """Main AnkiBrain loading function - determines and loads appropriate mode."""
     print("Booting AnkiBrain...")
-    boot_logger.startup_info("Starting AnkiBrain load sequence")
     log_startup_phase("Beginning AnkiBrain load")
 
-    with PerformanceTimer(boot_logger, "boot_checks"):
+    with FastTimer("boot_checks"):
         run_boot_checks()
 
-    with PerformanceTimer(boot_logger, "import_core_modules"):
+    with FastTimer("import_core_modules"):
         boot_logger.startup_info("Importing core modules")
-        from util import UserMode
-        from settings import SettingsManager
-        from project_paths import settings_path
+        core = _core_imports()
 
-    with PerformanceTimer(boot_logger, "initialize_settings_manager"):
+    with FastTimer("initialize_settings_manager"):
         boot_logger.startup_info(
-            "Initializing settings manager", {"settings_path": settings_path}
+            "Initializing settings manager", {"settings_path": core.settings_path}
         )
-        mw.settingsManager = SettingsManager(pth=settings_path)
-        user_mode: UserMode = mw.settingsManager.get_user_mode()
+        mw.settingsManager = core.SettingsManager(pth=core.settings_path)
+        user_mode = mw.settingsManager.get_user_mode()
         boot_logger.startup_info(
             "User mode determined", {"mode": user_mode.name if user_mode else "None"}
         )
 
-    if user_mode == UserMode.LOCAL:
+    if user_mode == core.UserMode.LOCAL:
         boot_logger.startup_info("Loading AnkiBrain in LOCAL mode")
         load_ankibrain_local_mode()
-    elif user_mode == UserMode.SERVER:
+    elif user_mode == core.UserMode.SERVER:
         boot_logger.startup_info("Loading AnkiBrain in SERVER mode")
         load_ankibrain_server_mode()
     else:
         boot_logger.startup_warning("No user mode set - showing mode selection dialog")
         # No mode set, ask the user.
-        with PerformanceTimer(boot_logger, "import_user_mode_dialog"):
+        with FastTimer("import_user_mode_dialog"):
             from UserModeDialog import show_user_mode_dialog
 
         show_user_mode_dialog()
 
-    boot_logger.startup_info("AnkiBrain load sequence completed")
     log_startup_phase("AnkiBrain load completed")
 
 
 def load_ankibrain_local_mode():
     """Load AnkiBrain in local mode - handles installation check and AnkiBrain instance creation."""
     print("Loading AnkiBrain in Local Mode...")
-    boot_logger.startup_info("Entering local mode loading sequence")
     log_startup_phase("Loading AnkiBrain Local Mode")
 
-    with PerformanceTimer(boot_logger, "import_local_mode_dependencies"):
-        from util import has_ankibrain_completed_install, UserMode
-        from InstallDialog import InstallDialog, show_install_dialog
+    with FastTimer("import_local_mode_dependencies"):
+        core = _core_imports()
 
-    with PerformanceTimer(boot_logger, "check_installation_status"):
-        installation_complete = has_ankibrain_completed_install()
+    with FastTimer("check_installation_status"):
+        installation_complete = core.has_ankibrain_completed_install()
         boot_logger.startup_info(
             "Installation status checked", {"installed": installation_complete}
         )
@@ -122,12 +180,12 @@ def load_ankibrain_local_mode():
             "AnkiBrain installation detected - creating main instance"
         )
 
-        with PerformanceTimer(boot_logger, "import_ankibrain_module"):
-            from AnkiBrainModule import AnkiBrain
+        with FastTimer("import_ankibrain_module"):
+            ankibrain_module = _ankibrain_imports()
 
-        with PerformanceTimer(boot_logger, "create_ankibrain_instance"):
+        with FastTimer("create_ankibrain_instance"):
             boot_logger.startup_info("Creating AnkiBrain instance in LOCAL mode")
-            ankiBrain = AnkiBrain(user_mode=UserMode.LOCAL)
+            ankiBrain = ankibrain_module.AnkiBrain(user_mode=core.UserMode.LOCAL)
             mw.ankiBrain = ankiBrain
             boot_logger.startup_info(
                 "AnkiBrain instance created and assigned to mw.ankiBrain"
@@ -137,15 +195,16 @@ def load_ankibrain_local_mode():
             "AnkiBrain not fully installed - showing installation dialog"
         )
 
-        with PerformanceTimer(boot_logger, "setup_installation_dialog"):
-            mw.installDialog = InstallDialog(mw)
+        with FastTimer("setup_installation_dialog"):
+            install_dialogs = _install_dialog_imports()
+            mw.installDialog = install_dialogs.InstallDialog(mw)
             mw.installDialog.hide()
             boot_logger.startup_info("Installation dialog created")
 
-        with PerformanceTimer(boot_logger, "setup_installation_menu"):
-            from AnkiBrainModule import add_ankibrain_menu_item
+        with FastTimer("setup_installation_menu"):
+            add_ankibrain_menu_item = _ankibrain_imports().add_ankibrain_menu_item
 
-            add_ankibrain_menu_item("Install...", show_install_dialog)
+            add_ankibrain_menu_item("Install...", install_dialogs.show_install_dialog)
             boot_logger.startup_info("Install menu item added")
 
             def show_user_mode_dialog():
@@ -158,26 +217,23 @@ def load_ankibrain_local_mode():
             add_ankibrain_menu_item("Switch User Mode...", show_user_mode_dialog)
             boot_logger.startup_info("User mode switch menu item added")
 
-    boot_logger.startup_info("Local mode loading completed")
     log_startup_phase("AnkiBrain Local Mode Loaded")
 
 
 def load_ankibrain_server_mode():
     """Load AnkiBrain in server mode - creates AnkiBrain instance configured for server usage."""
     print("Loading AnkiBrain in Regular (Server) Mode...")
-    boot_logger.startup_info("Entering server mode loading sequence")
     log_startup_phase("Loading AnkiBrain Server Mode")
 
-    with PerformanceTimer(boot_logger, "import_server_mode_dependencies"):
-        from AnkiBrainModule import AnkiBrain
-        from util import UserMode
+    with FastTimer("import_server_mode_dependencies"):
+        core = _core_imports()
+        ankibrain_module = _ankibrain_imports()
 
-    with PerformanceTimer(boot_logger, "create_server_mode_instance"):
+    with FastTimer("create_server_mode_instance"):
         boot_logger.startup_info("Creating AnkiBrain instance in SERVER mode")
-        mw.ankiBrain = AnkiBrain(user_mode=UserMode.SERVER)
+        mw.ankiBrain = ankibrain_module.AnkiBrain(user_mode=core.UserMode.SERVER)
         boot_logger.startup_info("Server mode AnkiBrain instance created and assigned")
 
-    boot_logger.startup_info("Server mode loading completed")
     log_startup_phase("AnkiBrain Server Mode Loaded")
 
 
@@ -194,9 +250,7 @@ def unload_ankibrain():
         print("Destroying mw SettingsManager instance...")
         mw.settingsManager = None
 
-    from AnkiBrainModule import remove_ankibrain_menu_actions
-
-    remove_ankibrain_menu_actions()
+    _ankibrain_imports().remove_ankibrain_menu_actions()
 
 
 def reload_ankibrain():
@@ -9,7 +9,9 @@ that are not yet supported by the current langchain version.
 """
 
 import logging
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
@@ -26,22 +28,37 @@ MODEL_COMPATIBILITY_MAP: Dict[str, str] = {
 }
 
 # Models known to be supported by langchain 0.0.231
-SUPPORTED_MODELS = [
-    "gpt-3.5-turbo",
-    "gpt-3.5-turbo-16k",
-    "gpt-3.5-turbo-0613",
-    "gpt-3.5-turbo-16k-0613",
-    "gpt-4",
-    "gpt-4-0613",
-    "gpt-4-32k",
-    "gpt-4-32k-0613",
-    "gpt-4-turbo",
-    "text-davinci-003",
-    "text-davinci-002",
-    "code-davinci-002",
-]
-
-
+SUPPORTED_MODELS: FrozenSet[str] = frozenset(
+    [
+        "gpt-3.5-turbo",
+        "gpt-3.5-turbo-16k",
+        "gpt-3.5-turbo-0613",
+        "gpt-3.5-turbo-16k-0613",
+        "gpt-4",
+        "gpt-4-0613",
+        "gpt-4-32k",
+        "gpt-4-32k-0613",
+        "gpt-4-turbo",
+        "text-davinci-003",
+        "text-davinci-002",
+        "code-davinci-002",
+    ]
+)
+
+# Single-probe resolution table: supported models map to themselves and
+# unsupported models map to their compatible alternative, so the common
+# path is one dict lookup instead of a list scan plus a dict lookup.
+_RESOLVED: Dict[str, str] = {m: m for m in SUPPORTED_MODELS}
+_RESOLVED.update(MODEL_COMPATIBILITY_MAP)
+
+# Versioned variants like "gpt-5-2024-08-01" or "gpt-5-mini-preview" should
+# resolve to the same alternative as their base family instead of tripping
+# the unknown-model warning. Compiled once; group 1 captures the family
+# name, which is always a MODEL_COMPATIBILITY_MAP key.
+_FAMILY_RE = re.compile(r"^(gpt-5(?:\.0)?(?:-mini|-turbo)?)(?:-[\w.-]+)?$")
+
+
+@lru_cache(maxsize=128)
 def get_compatible_model_name(requested_model: str) -> str:
     """
     Get a compatible model name for the requested model.
@@ -65,28 +82,42 @@ def get_compatible_model_name(requested_model: str) -> str:
         >>> get_compatible_model_name("gpt-5-mini")
         'gpt-4'
     """
-    if requested_model in SUPPORTED_MODELS:
-        # Model is already supported, return as-is
-        return requested_model
-
-    if requested_model in MODEL_COMPATIBILITY_MAP:
-        # Model has a known mapping, use the alternative
-        compatible_model = MODEL_COMPATIBILITY_MAP[requested_model]
+    compatible_model = _RESOLVED.get(requested_model)
+
+    if compatible_model is None:
+        # Versioned variant of a known unsupported family, e.g.
+        # "gpt-5-2024-08-01" -> same mapping as "gpt-5". The regex can
+        # capture families without a map entry (e.g. "gpt-5.0-turbo"), so a
+        # miss here falls through to the generic gpt-4 fallback below.
+        match = _FAMILY_RE.match(requested_model)
+        if match is not None:
+            compatible_model = MODEL_COMPATIBILITY_MAP.get(match.group(1))
+            if compatible_model is not None:
+                logger.info(
+                    f"Model '{requested_model}' resolved via family "
+                    f"'{match.group(1)}' to compatible alternative: "
+                    f"'{compatible_model}'"
+                )
+                return compatible_model
+
+        # Model is unknown - fallback to GPT-4 as it's the most capable
+        # supported model. Logged once per model name thanks to the
+        # lru_cache on this function.
+        logger.warning(
+            f"Unknown model '{requested_model}'. "
+            f"Using fallback model 'gpt-4' for compatibility."
+        )
+        return "gpt-4"
 
+    if compatible_model != requested_model:
+        # Model has a known mapping, use the alternative. Logged only once
+        # per model name thanks to the lru_cache on this function.
         logger.info(
             f"Model '{requested_model}' not supported by current langchain version. "
             f"Using compatible alternative: '{compatible_model}'"
         )
 
-        return compatible_model
-
-    # Model is unknown - fallback to GPT-4 as it's the most capable supported model
-    logger.warning(
-        f"Unknown model '{requested_model}'. "
-        f"Using fallback model 'gpt-4' for compatibility."
-    )
-
-    return "gpt-4"
+    return compatible_model
 
 
 def is_model_supported(model_name: str) -> bool:
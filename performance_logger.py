@@ -15,11 +15,16 @@ Usage:
         pass
 """
 
+import atexit
 import logging
+import queue
 import time
-import json
 import threading
+from logging.handlers import QueueHandler, QueueListener
+
+import fastjson
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 import os
@@ -33,42 +38,45 @@ class PerformanceFormatter(logging.Formatter):
 
     def __init__(self):
         super().__init__()
-        self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
 
     def format(self, record):
-        # Calculate time since logger initialization
-        elapsed_time = (
-            record.created - self.start_time
-        ) * 1000  # Convert to milliseconds
-
-        # Build structured log entry
-        log_data = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S.%f")[
-                :-3
-            ],  # Include milliseconds
-            "elapsed_ms": round(elapsed_time, 2),
-            "thread": record.thread,
-            "process": record.process,
-            "level": record.levelname,
-            "module": record.name,
-            "message": record.getMessage(),
-        }
+        # Milliseconds since formatter creation, from the monotonic clock.
+        elapsed_ms = (time.perf_counter_ns() - self._start_ns) / 1e6
+
+        # Write the JSON line directly instead of building a dict and
+        # encoding it per record: only the free-form fields need escaping,
+        # the numeric/level fields are interpolated as-is. Wall-clock time
+        # is carried as the epoch "ts" field; consumers derive local time
+        # from it rather than paying a strftime call per record.
+        parts = [
+            f'{{"ts":{record.created:.3f}',
+            f'"elapsed_ms":{elapsed_ms:.2f}',
+            f'"thread":{record.thread}',
+            f'"process":{record.process}',
+            f'"level":"{record.levelname}"',
+            f'"module":"{record.name}"',
+            f'"message":{fastjson.dumps(record.getMessage())}',
+        ]
 
         # Add performance metrics if available
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        duration_ms = getattr(record, "duration_ms", None)
+        if duration_ms is not None:
+            parts.append(f'"duration_ms":{duration_ms}')
 
-        if hasattr(record, "operation"):
-            log_data["operation"] = record.operation
+        operation = getattr(record, "operation", None)
+        if operation is not None:
+            parts.append(f'"operation":{fastjson.dumps(operation)}')
 
-        if hasattr(record, "context"):
-            log_data["context"] = record.context
+        context = getattr(record, "context", None)
+        if context is not None:
+            parts.append(f'"context":{fastjson.dumps(context)}')
 
-        if hasattr(record, "memory_mb"):
-            log_data["memory_mb"] = record.memory_mb
+        memory_mb = getattr(record, "memory_mb", None)
+        if memory_mb is not None:
+            parts.append(f'"memory_mb":{memory_mb}')
 
-        # Format as structured JSON for easy analysis
-        return json.dumps(log_data, separators=(",", ":"))
+        return ",".join(parts) + "}"
 
 
 # Project-specific performance thresholds based on AnkiBrain requirements
@@ -102,22 +110,98 @@ PERFORMANCE_THRESHOLDS = {
 }
 
 
+# Split once at module load so per-call lookup is a dict probe. The prefix
+# patterns all take the form "<verb>_", so they are bucketed by that first
+# underscore-separated segment and matched with a single hash lookup
+# instead of a startswith scan.
+_EXACT_THRESHOLDS = {
+    k: v for k, v in PERFORMANCE_THRESHOLDS.items() if not k.endswith("_")
+}
+_PREFIX_BUCKETS = {
+    k[:-1]: v for k, v in PERFORMANCE_THRESHOLDS.items() if k.endswith("_")
+}
+
+
+@lru_cache(maxsize=256)
 def get_threshold_for_operation(operation: str) -> float:
     """
     Get performance threshold for specific operation.
     Uses project-specific thresholds based on AnkiBrain performance requirements.
     """
     # Check for exact match first
-    if operation in PERFORMANCE_THRESHOLDS:
-        return PERFORMANCE_THRESHOLDS[operation]
+    threshold = _EXACT_THRESHOLDS.get(operation)
+    if threshold is not None:
+        return threshold
+
+    # Fall back to the operation's verb bucket ("setup", "import", ...),
+    # then the default threshold for unmatched operations (5 seconds as per
+    # requirements).
+    return _PREFIX_BUCKETS.get(operation.split("_", 1)[0], 5000)
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """
+    F-string console formatter. Faster than the %-style path, and records
+    that lack elapsed_ms (e.g. from foreign logging calls routed through
+    these loggers) fall back to 0.0 instead of crashing the handler.
+    """
+
+    def format(self, record):
+        elapsed_ms = getattr(record, "elapsed_ms", 0.0)
+        return f"[{elapsed_ms:06.1f}ms] {record.name}: {record.getMessage()}"
+
+
+# psutil availability is resolved once; repeated calls hit a bool check
+# instead of re-raising/catching ImportError per memory read.
+_psutil = None
+_psutil_checked = False
+
+
+def _get_psutil():
+    global _psutil, _psutil_checked
+    if not _psutil_checked:
+        try:
+            import psutil
+
+            _psutil = psutil
+        except ImportError:
+            _psutil = None
+        _psutil_checked = True
+    return _psutil
+
+
+# Single shared write path for every logger instance. Previously each
+# PerformanceLogger opened its own FileHandler on the same log file (one FD
+# and one blocking write path per logger name). Records are now funneled
+# through a queue to one FileHandler, so JSON formatting and disk I/O happen
+# on a background listener thread instead of the boot path. delay=True keeps
+# the file closed until the first record is actually written.
+_log_dir = Path("logs")
+_log_dir.mkdir(exist_ok=True)
+_DEFAULT_LOG_FILE = _log_dir / "ankibrain_performance.log"
+_shared_file_handler = logging.FileHandler(
+    _DEFAULT_LOG_FILE, mode="a", encoding="utf-8", delay=True
+)
+_shared_file_handler.setLevel(logging.DEBUG)
+_shared_file_handler.setFormatter(PerformanceFormatter())
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setLevel(logging.DEBUG)
+
+_queue_listener = QueueListener(
+    _log_queue, _shared_file_handler, respect_handler_level=True
+)
+_queue_listener.start()
 
-    # Check for pattern matches (operations starting with specific prefixes)
-    for pattern, threshold in PERFORMANCE_THRESHOLDS.items():
-        if pattern.endswith("_") and operation.startswith(pattern):
-            return threshold
 
-    # Default threshold for unmatched operations (5 seconds as per requirements)
-    return 5000
+def _stop_queue_listener():
+    # QueueListener.stop() is not idempotent; skip if already stopped.
+    if _queue_listener._thread is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
 
 
 class PerformanceLogger:
@@ -139,20 +223,19 @@ class PerformanceLogger:
             # Console handler for immediate feedback
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
-            console_formatter = logging.Formatter(
-                "[%(elapsed_ms)06.1fms] %(name)s: %(message)s"
-            )
-            console_handler.setFormatter(console_formatter)
+            console_handler.setFormatter(_ConsoleFormatter())
 
-            # File handler for detailed analysis
+            # File output for detailed analysis. The default path goes
+            # through the shared queue handler; an explicit log_file still
+            # gets its own dedicated handler.
             if log_file is None:
-                log_dir = Path("logs")
-                log_dir.mkdir(exist_ok=True)
-                log_file = log_dir / "ankibrain_performance.log"
-
-            file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(PerformanceFormatter())
+                file_handler = _queue_handler
+            else:
+                file_handler = logging.FileHandler(
+                    log_file, mode="a", encoding="utf-8"
+                )
+                file_handler.setLevel(logging.DEBUG)
+                file_handler.setFormatter(PerformanceFormatter())
 
             self.logger.addHandler(console_handler)
             self.logger.addHandler(file_handler)
@@ -170,6 +253,8 @@ class PerformanceLogger:
 
     def startup_info(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log startup-specific information with context."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         record = self.logger.makeRecord(
             self.logger.name, logging.INFO, "", 0, message, (), None
         )
@@ -178,6 +263,8 @@ class PerformanceLogger:
 
     def startup_warning(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log startup warnings that may indicate performance issues."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         record = self.logger.makeRecord(
             self.logger.name, logging.WARNING, "", 0, message, (), None
         )
@@ -188,6 +275,8 @@ class PerformanceLogger:
         self, message: str, context: Optional[Dict[str, Any]] = None, exc_info=None
     ):
         """Log startup errors with full context."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         record = self.logger.makeRecord(
             self.logger.name, logging.ERROR, "", 0, message, (), exc_info
         )
@@ -199,6 +288,8 @@ class PerformanceLogger:
         start_time = time.time()
         self._timers[operation] = start_time
 
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         message = f"Starting {operation}"
         record = self.logger.makeRecord(
             self.logger.name, logging.DEBUG, "", 0, message, (), None
@@ -215,6 +306,8 @@ class PerformanceLogger:
         duration = (time.time() - self._timers[operation]) * 1000  # Convert to ms
         del self._timers[operation]
 
+        if not self.logger.isEnabledFor(logging.INFO):
+            return duration
         message = f"Completed {operation}"
         record = self.logger.makeRecord(
             self.logger.name, logging.INFO, "", 0, message, (), None
@@ -228,25 +321,23 @@ class PerformanceLogger:
 
     def log_memory_usage(self, operation: str = "memory_check"):
         """Log current memory usage (if psutil is available)."""
-        try:
-            import psutil
+        psutil = _get_psutil()
+        if psutil is None:
+            return None
 
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
+        process = psutil.Process()
+        memory_mb = process.memory_info().rss / 1024 / 1024
 
-            message = f"Memory usage: {memory_mb:.1f} MB"
-            record = self.logger.makeRecord(
-                self.logger.name, logging.DEBUG, "", 0, message, (), None
-            )
-            self._add_performance_data(
-                record, operation=operation, memory_mb=round(memory_mb, 1)
-            )
-            self.logger.handle(record)
+        message = f"Memory usage: {memory_mb:.1f} MB"
+        record = self.logger.makeRecord(
+            self.logger.name, logging.DEBUG, "", 0, message, (), None
+        )
+        self._add_performance_data(
+            record, operation=operation, memory_mb=round(memory_mb, 1)
+        )
+        self.logger.handle(record)
 
-            return memory_mb
-        except ImportError:
-            self.startup_info("psutil not available for memory tracking")
-            return None
+        return memory_mb
 
     def log_bottleneck_warning(
         self, operation: str, duration_ms: float, threshold_ms: float = None
@@ -269,6 +360,13 @@ class PerformanceLogger:
             )
 
 
+# Per-timer DEBUG tracing is opt-in: set ANKIBRAIN_PERF_LOG=1 to get the
+# full start/end records. When disabled (the default for end users), every
+# `with PerformanceTimer(...)` is just a generator enter/exit with no
+# makeRecord/formatting work at all.
+_PERF_ENABLED = os.environ.get("ANKIBRAIN_PERF_LOG", "0") == "1"
+
+
 @contextmanager
 def PerformanceTimer(
     logger: PerformanceLogger, operation: str, context: Optional[Dict[str, Any]] = None
@@ -299,6 +397,74 @@ def PerformanceTimer(
         logger.log_bottleneck_warning(operation, duration_ms)
 
 
+if not _PERF_ENABLED:
+
+    @contextmanager
+    def PerformanceTimer(  # noqa: F811
+        logger: PerformanceLogger,
+        operation: str,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        """No-op variant bound when ANKIBRAIN_PERF_LOG is not set."""
+        yield
+
+
+# Timers recorded by FastTimer, waiting to be flushed after boot.
+_PENDING_TIMERS = []
+
+
+class FastTimer:
+    """
+    Near-zero-overhead timer for the boot critical path.
+
+    Unlike PerformanceTimer, entering/exiting only records two perf_counter
+    readings into a pending list; all record construction, JSON formatting
+    and file I/O is deferred until flush_pending_timers() runs after boot.
+    """
+
+    __slots__ = ("name", "t0", "t1")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.t0 = 0.0
+        self.t1 = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.t1 = time.perf_counter()
+        _PENDING_TIMERS.append(self)
+
+
+def flush_pending_timers():
+    """Emit one timing record per recorded FastTimer and clear the batch."""
+    if not _PENDING_TIMERS:
+        return
+
+    logger = get_performance_logger("StartupPhases")
+    pending = _PENDING_TIMERS[:]
+    del _PENDING_TIMERS[:]
+
+    for timer in pending:
+        duration_ms = (timer.t1 - timer.t0) * 1000
+        record = logger.logger.makeRecord(
+            logger.logger.name,
+            logging.INFO,
+            "",
+            0,
+            f"Completed {timer.name}",
+            (),
+            None,
+        )
+        logger._add_performance_data(
+            record, operation=timer.name, duration_ms=round(duration_ms, 2)
+        )
+        logger.logger.handle(record)
+        logger.log_bottleneck_warning(timer.name, duration_ms)
+
+
 # Global logger instances for consistent usage across modules
 _logger_instances: Dict[str, PerformanceLogger] = {}
 _logger_lock = threading.Lock()
@@ -311,10 +477,19 @@ def get_performance_logger(
     Get or create a performance logger instance.
     Thread-safe singleton pattern per logger name.
     """
+    # Lock-free fast path: dict reads are atomic under the GIL and every
+    # timer/log call funnels through here, so the lock is only taken for
+    # first-creation arbitration on a miss.
+    instance = _logger_instances.get(name)
+    if instance is not None:
+        return instance
+
     with _logger_lock:
-        if name not in _logger_instances:
-            _logger_instances[name] = PerformanceLogger(name, log_file)
-        return _logger_instances[name]
+        instance = _logger_instances.get(name)
+        if instance is None:
+            instance = PerformanceLogger(name, log_file)
+            _logger_instances[name] = instance
+        return instance
 
 
 def log_startup_phase(phase: str, details: Optional[Dict[str, Any]] = None):
@@ -326,26 +501,34 @@ def log_startup_phase(phase: str, details: Optional[Dict[str, Any]] = None):
     logger.startup_info(f"Startup Phase: {phase}", details or {})
 
 
-def log_system_info():
-    """Log system information relevant to startup performance."""
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, str]:
+    """
+    Gather the system facts that never change for the life of the process.
+    platform.platform()/processor() can hit subprocesses or the registry on
+    some OSes, so the result is computed once and reused.
+    """
     import platform
     import sys
 
-    logger = get_performance_logger("SystemInfo")
-
-    system_info = {
+    return {
         "python_version": sys.version.split()[0],
         "platform": platform.platform(),
         "processor": platform.processor(),
         "python_implementation": platform.python_implementation(),
+        # Captured once: the getcwd syscall result is only read for logging.
         "current_working_directory": os.getcwd(),
     }
 
-    logger.startup_info("System Information", system_info)
-    logger.log_memory_usage("startup_system_info")
 
+def log_system_info():
+    """
+    Log system information relevant to startup performance.
+
+    Not called at import time: platform/psutil probes can block for 100ms+
+    on some systems, so the boot handler runs this on a background thread.
+    """
+    logger = get_performance_logger("SystemInfo")
 
-# Initialize logging immediately when module is imported
-if __name__ != "__main__":
-    log_startup_phase("PerformanceLogger module imported")
-    log_system_info()
+    logger.startup_info("System Information", _static_system_info())
+    logger.log_memory_usage("startup_system_info")
@@ -45,6 +45,8 @@ default_settings = {
     "user_mode": None,
     "llmModel": "gpt-3.5-turbo",
     "temperature": 0,
+    # Number of past conversation turns sent with each chat message.
+    "conversationWindowSize": 8,
     "user": None,
     "devMode": False,
     "showBootReminderDialog": True,
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Pytest suite verifying the GPT-5 model compatibility mapping.
+
+Run with `pytest tests/` from the add-on root (parallelizable via
+`pytest -n auto` when pytest-xdist is installed). This directory is
+deliberately not a package: collecting the tests from inside the add-on
+package would import its __init__.py, which registers Anki hooks and
+requires a full Anki install.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the add-on root to the path so model_compatibility imports as a
+# standalone module, without touching the package __init__.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model_compatibility import (
+    get_compatible_model_name,
+    is_model_supported,
+    get_model_info,
+    log_model_usage,
+)
+
+
+# Case tables as immutable module-level tuples: built once at import and
+# shared by the parametrize decorators.
+_COMPAT_CASES = (
+    ("gpt-3.5-turbo", "gpt-3.5-turbo"),  # Already supported
+    ("gpt-4", "gpt-4"),  # Already supported
+    ("gpt-5", "gpt-4"),  # Should map to gpt-4
+    ("gpt-5-mini", "gpt-4"),  # Should map to gpt-4
+    ("gpt-5-turbo", "gpt-4-turbo"),  # Should map to gpt-4-turbo
+    ("unknown-model", "gpt-4"),  # Unknown should fallback to gpt-4
+)
+
+_SUPPORT_CASES = (
+    ("gpt-3.5-turbo", True),
+    ("gpt-4", True),
+    ("gpt-5", False),
+    ("gpt-5-mini", False),
+)
+
+
+@pytest.mark.parametrize("requested,expected", _COMPAT_CASES)
+def test_compat_map(requested, expected):
+    assert get_compatible_model_name(requested) == expected
+
+
+@pytest.mark.parametrize("model,expected", _SUPPORT_CASES)
+def test_is_supported(model, expected):
+    assert is_model_supported(model) is expected
+
+
+def test_get_model_info():
+    assert get_model_info("gpt-5") == {
+        "original_model": "gpt-5",
+        "compatible_model": "gpt-4",
+        "is_mapped": True,
+        "is_supported": False,
+    }
+
+
+def test_log_model_usage_does_not_raise():
+    log_model_usage("gpt-5", "gpt-4")
+    log_model_usage("gpt-4", "gpt-4")